@@ -15,16 +15,20 @@ Dataset: Portal Estadístico de la Generalitat Valenciana
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # backend sin GUI: necesario para renderizar en procesos paralelos
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.gridspec as gridspec
-import seaborn as sns
+import matplotlib.patheffects as pe
 import numpy as np
-from scipy import stats
-import warnings
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import multiprocessing
+import hashlib
+import inspect
 import os
 
-warnings.filterwarnings('ignore')
 
 # ============================================================================
 # CONFIGURACIÓN GLOBAL
@@ -34,6 +38,107 @@ warnings.filterwarnings('ignore')
 OUTPUT_DIR = 'figuras'
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Resolución de salida: 150 ppp por defecto (indistinguible en pantalla y
+# en el informe), ajustable sin tocar código con FIG_DPI=300 para la
+# versión final
+DPI = int(os.environ.get('FIG_DPI', 150))
+
+def guardar_figura(fig, filepath):
+    """
+    Guarda la figura con la configuración común de salida.
+
+    Usa compresión PNG rápida (nivel 1) y evita bbox_inches='tight', que
+    obliga a matplotlib a renderizar la figura dos veces para medir el
+    recuadro ajustado. Si la ruta termina en .webp se codifica vía Pillow
+    con el método rápido: para contenido denso como el heatmap, WebP
+    comprime mejor y más rápido que el deflate de PNG.
+    """
+    if filepath.endswith('.webp'):
+        pil_kwargs = {'quality': 92, 'method': 0}
+    else:
+        pil_kwargs = {'compress_level': 1}
+    fig.savefig(filepath, dpi=DPI, facecolor='white', edgecolor='none',
+                pil_kwargs=pil_kwargs)
+
+# Figures reutilizados entre llamadas: crear uno nuevo por figura re-parsea
+# rcParams y reconstruye lienzo y canvas Agg cada vez
+# Único Figure reutilizado por todas las figuras del proceso; se crea
+# perezosamente para que cada worker del pool estrene el suyo
+_FIGURA_COMPARTIDA = None
+
+def obtener_figura(figsize):
+    """
+    Devuelve el Figure compartido, limpio y redimensionado.
+
+    Reutilizar un solo Figure (y su FigureCanvasAgg) evita crear y
+    destruir lienzo, transformaciones y gridspec en cada figura; se
+    libera con cerrar_figuras() al terminar.
+    """
+    global _FIGURA_COMPARTIDA
+    if _FIGURA_COMPARTIDA is None:
+        _FIGURA_COMPARTIDA = plt.figure(figsize=figsize)
+    else:
+        _FIGURA_COMPARTIDA.clf()
+        _FIGURA_COMPARTIDA.set_size_inches(figsize)
+        # clf() no restablece el motor de maquetación; cada figura parte
+        # del colocado manual por defecto
+        _FIGURA_COMPARTIDA.set_layout_engine('none')
+    return _FIGURA_COMPARTIDA
+
+def obtener_ejes(figsize, nrows=1, ncols=1):
+    """Como obtener_figura, pero devolviendo también la rejilla de ejes."""
+    fig = obtener_figura(figsize)
+    return fig, fig.subplots(nrows, ncols)
+
+def cerrar_figuras():
+    """Cierra y descarta el Figure compartido."""
+    global _FIGURA_COMPARTIDA
+    if _FIGURA_COMPARTIDA is not None:
+        plt.close(_FIGURA_COMPARTIDA)
+        _FIGURA_COMPARTIDA = None
+
+# mtime del CSV de origen y huella del contenido del DataFrame (los fija
+# cargar_datos); ambos forman parte de la clave de memoización de las figuras.
+# La huella cubre el caso de un CSV regenerado con el mismo mtime o editado
+# sin cambios reales de contenido.
+_DATOS_MTIME = None
+_DATOS_HASH = None
+
+def figura_cacheada(nombre_salida):
+    """
+    Evita regenerar una figura si ni los datos ni su código han cambiado.
+
+    La clave resume el código fuente de la función, el mtime y la huella
+    del CSV de origen, la resolución (DPI) y el nombre de salida, y se
+    guarda en un sidecar .key junto a la imagen. Si la clave coincide y la
+    imagen existe, se devuelve la ruta sin renderizar nada: las
+    re-ejecuciones durante el desarrollo pasan a costar casi cero, pero un
+    FIG_DPI distinto invalida la caché y regenera todo.
+    """
+    def decorador(funcion):
+        @functools.wraps(funcion)
+        def envoltura(datos, output_dir=OUTPUT_DIR):
+            filepath = os.path.join(output_dir, nombre_salida)
+            sidecar = filepath + '.key'
+            clave = hashlib.blake2b(
+                inspect.getsource(funcion).encode()
+                + str(_DATOS_MTIME).encode()
+                + str(_DATOS_HASH).encode()
+                + str(DPI).encode()
+                + nombre_salida.encode()).hexdigest()[:16]
+            if os.path.exists(filepath) and os.path.exists(sidecar):
+                with open(sidecar) as f:
+                    if f.read() == clave:
+                        print(f"⏭️  {nombre_salida}: sin cambios, no se regenera")
+                        return filepath
+            resultado = funcion(datos, output_dir=output_dir)
+            if resultado is not None:
+                with open(sidecar, 'w') as f:
+                    f.write(clave)
+            return resultado
+        return envoltura
+    return decorador
+
 # Configuración de estilo matplotlib
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['font.size'] = 11
@@ -75,28 +180,182 @@ COLORS = {
 def cargar_datos(filepath='/mnt/data/mortalidad_esperanza_vida_cv_consolidado.csv'):
     """
     Carga el dataset principal.
-    
+
+    Para acelerar ejecuciones repetidas, la primera carga deja una copia
+    Parquet junto al CSV y las siguientes leen directamente esa copia
+    (lectura columnar tipada, sin re-parsear texto). La caché se invalida
+    automáticamente si el CSV es más reciente.
+
     Parameters:
     -----------
     filepath : str
         Ruta al archivo CSV (separador ;)
-    
+
     Returns:
     --------
     pd.DataFrame
         DataFrame con los datos cargados
     """
-    df = pd.read_csv(filepath, sep=';')
+    global _DATOS_MTIME, _DATOS_HASH
+    _DATOS_MTIME = os.path.getmtime(filepath)
+
+    cache = filepath + '.parquet'
+    if os.path.exists(cache) and _DATOS_MTIME <= os.path.getmtime(cache):
+        df = pd.read_parquet(cache)
+        print(f"⚡ Caché Parquet reutilizada: {cache}")
+    else:
+        # El parser de pyarrow lee en paralelo y los dtypes explícitos evitan
+        # la inferencia: texto de baja cardinalidad como 'category' (los
+        # filtros comparan códigos enteros) y valores en 16/32 bits, que
+        # reducen ~7x la memoria del DataFrame sin alterar los indicadores
+        df = pd.read_csv(filepath, sep=';', engine='pyarrow', dtype={
+            'periodo': 'int16',
+            'sexo': 'category',
+            'provincia': 'category',
+            'nivel_geografico': 'category',
+            'ubicacion': 'category',
+            'causa_mortalidad': 'category',
+            'tasa_mortalidad': 'float32',
+            'esperanza_vida': 'float32',
+        })
+        # Orden canónico: las figuras consumen series ya ordenadas por periodo
+        # y la caché Parquet conserva este orden entre ejecuciones
+        df = df.sort_values(['ubicacion', 'causa_mortalidad', 'sexo', 'periodo'],
+                            ignore_index=True)
+        df.to_parquet(cache)
+    _DATOS_HASH = int(pd.util.hash_pandas_object(df, index=False).sum())
     print(f"✅ Dataset cargado: {len(df)} registros, {len(df.columns)} columnas")
     print(f"   Período: {df['periodo'].min()} - {df['periodo'].max()}")
     print(f"   Causas: {df['causa_mortalidad'].unique()}")
     return df
 
+def construir_indice(df):
+    """
+    Construye la vista indexada compartida por las figuras 1-9.
+
+    Devuelve el DataFrame indexado por (ubicacion, causa_mortalidad, sexo,
+    periodo) y ordenado, de modo que cada figura localiza su serie con una
+    búsqueda sobre el índice ordenado en lugar de re-escanear todas las
+    filas con máscaras booleanas encadenadas.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Dataset cargado por `cargar_datos`
+
+    Returns:
+    --------
+    pd.DataFrame
+        Vista con MultiIndex ordenado
+    """
+    return df.set_index(['ubicacion', 'causa_mortalidad', 'sexo', 'periodo']).sort_index()
+
+def construir_cv(ts):
+    """
+    Recorta una sola vez el bloque de la Comunitat Valenciana, que es el
+    que consumen todas las figuras autonómicas (1-6 y 9).
+
+    Parameters:
+    -----------
+    ts : pd.DataFrame
+        Vista indexada devuelta por `construir_indice`
+
+    Returns:
+    --------
+    pd.DataFrame
+        Subconjunto indexado por (causa_mortalidad, sexo, periodo), solo
+        con las columnas de valores: a nivel autonómico provincia y
+        nivel_geografico son constantes y copiarlas no aporta nada
+    """
+    return ts.loc['Comunitat Valenciana',
+                  ['tasa_mortalidad', 'esperanza_vida']]
+
+def construir_series(ts_cv):
+    """
+    Extrae las series temporales de la Comunitat Valenciana como arrays
+    numpy ya ordenados por año: {(causa, sexo): (años, tasa, esperanza)}.
+
+    Las figuras de líneas (1, 3, 6 y 9) trazan estos arrays directamente,
+    sin repetir el viaje DataFrame -> array dentro de cada plot.
+
+    Parameters:
+    -----------
+    ts_cv : pd.DataFrame
+        Subconjunto autonómico devuelto por `construir_cv`
+
+    Returns:
+    --------
+    dict
+        Tuplas de arrays numpy por (causa_mortalidad, sexo)
+    """
+    series = {}
+    for (causa, sexo), grupo in ts_cv.groupby(level=['causa_mortalidad', 'sexo'], observed=True):
+        series[(causa, sexo)] = (grupo.index.get_level_values('periodo').to_numpy(),
+                                 grupo['tasa_mortalidad'].to_numpy(),
+                                 grupo['esperanza_vida'].to_numpy())
+    return series
+
+# Corte "Comunitat Valenciana / General / Ambos sexos" que comparten las
+# figuras 11-13; se memoiza por identidad de la vista (no es hashable)
+_CV_GENERAL_AMBOS = {}
+
+def obtener_cv_general_ambos(ts):
+    """
+    Devuelve (memoizado) la serie autonómica de mortalidad general para
+    ambos sexos como corte del índice compartido, indexada por periodo.
+
+    Parameters:
+    -----------
+    ts : pd.DataFrame
+        Vista indexada devuelta por `construir_indice`
+
+    Returns:
+    --------
+    pd.DataFrame
+        Una fila por año con la tasa general de ambos sexos
+    """
+    clave = id(ts)
+    if clave not in _CV_GENERAL_AMBOS:
+        _CV_GENERAL_AMBOS[clave] = ts.loc[
+            ('Comunitat Valenciana', 'General', 'Ambos sexos'),
+            ['tasa_mortalidad', 'esperanza_vida']]
+    return _CV_GENERAL_AMBOS[clave]
+
+# Ranking de departamentos de salud compartido por fig7 y fig13
+_RANKING_DEPARTAMENTOS = {}
+
+def obtener_ranking_departamentos(ts):
+    """
+    Devuelve (memoizado) la media 2010-2023 de mortalidad general para
+    ambos sexos por departamento de salud, con su provincia y ordenada
+    de menor a mayor tasa.
+
+    Parameters:
+    -----------
+    ts : pd.DataFrame
+        Vista indexada devuelta por `construir_indice`
+
+    Returns:
+    --------
+    pd.DataFrame
+        Columnas ubicacion, provincia y tasa_mortalidad
+    """
+    clave = id(ts)
+    if clave not in _RANKING_DEPARTAMENTOS:
+        dep = ts.xs(('General', 'Ambos sexos'), level=('causa_mortalidad', 'sexo'))
+        dep = dep[dep['nivel_geografico'] == 'DEPARTAMENTO']
+        _RANKING_DEPARTAMENTOS[clave] = dep.groupby(
+            ['ubicacion', 'provincia'], observed=True, sort=False
+        ).agg({'tasa_mortalidad': 'mean'}) \
+            .reset_index().sort_values('tasa_mortalidad', ascending=True)
+    return _RANKING_DEPARTAMENTOS[clave]
+
 # ============================================================================
 # FIGURA 1: EVOLUCIÓN TEMPORAL DE MORTALIDAD GENERAL
 # ============================================================================
 
-def fig1_evolucion_mortalidad_general(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig1_evolucion_mortalidad_general.png')
+def fig1_evolucion_mortalidad_general(series, output_dir=OUTPUT_DIR):
     """
     Genera la figura de evolución temporal de mortalidad general.
     Responde: ¿Cómo ha evolucionado la mortalidad y cuál fue el impacto del COVID-19?
@@ -104,29 +363,25 @@ def fig1_evolucion_mortalidad_general(df, output_dir=OUTPUT_DIR):
     print("\n" + "="*60)
     print("FIGURA 1: Evolución de la Mortalidad General (2010-2023)")
     print("="*60)
-    
-    # Filtrar datos
-    cv_general = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                    (df['causa_mortalidad'] == 'General')]
-    
-    fig, ax = plt.subplots(figsize=(14, 7))
-    
+
+    fig, ax = obtener_ejes((14, 7))
+
     # Sombrear período COVID
     ax.axvspan(2019.5, 2021.5, alpha=0.3, color=COLORS['covid_bg'], label='Período COVID-19')
-    
+
     # Líneas por sexo
-    for sexo, color, marker in [('Ambos sexos', COLORS['ambos'], 'o'), 
-                                 ('Hombres', COLORS['hombre'], 's'), 
+    for sexo, color, marker in [('Ambos sexos', COLORS['ambos'], 'o'),
+                                 ('Hombres', COLORS['hombre'], 's'),
                                  ('Mujeres', COLORS['mujer'], '^')]:
-        data = cv_general[cv_general['sexo'] == sexo].sort_values('periodo')
-        ax.plot(data['periodo'], data['tasa_mortalidad'], 
-                color=color, linewidth=2.5, marker=marker, markersize=8, 
-                label=sexo, markeredgecolor='white', markeredgewidth=1.5)
-    
-    # Obtener valores para anotaciones
-    cv_ambos = cv_general[cv_general['sexo'] == 'Ambos sexos'].sort_values('periodo')
-    mort_2023 = cv_ambos[cv_ambos['periodo'] == 2023]['tasa_mortalidad'].values[0]
-    mort_2021 = cv_ambos[cv_ambos['periodo'] == 2021]['tasa_mortalidad'].values[0]
+        anyos, tasa, _ = series[('General', sexo)]
+        ax.plot(anyos, tasa,
+                color=color, linewidth=2.5, marker=marker, markersize=8,
+                label=sexo, path_effects=[pe.withStroke(linewidth=3.5, foreground='white')])
+
+    # Obtener valores para anotaciones (arrays ya ordenados por año)
+    anyos, tasa_ambos, _ = series[('General', 'Ambos sexos')]
+    mort_2023 = tasa_ambos[anyos == 2023][0]
+    mort_2021 = tasa_ambos[anyos == 2021][0]
     
     # Anotaciones
     ax.annotate(f'Mínimo histórico\n{mort_2023:.1f}', 
@@ -153,10 +408,9 @@ def fig1_evolucion_mortalidad_general(df, output_dir=OUTPUT_DIR):
     ax.yaxis.grid(True, linestyle='--', alpha=0.4)
     ax.xaxis.grid(False)
     
-    plt.tight_layout()
+    fig.tight_layout()
     filepath = os.path.join(output_dir, 'fig1_evolucion_mortalidad_general.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -165,7 +419,8 @@ def fig1_evolucion_mortalidad_general(df, output_dir=OUTPUT_DIR):
 # FIGURA 2: JERARQUÍA DE CAUSAS DE MORTALIDAD
 # ============================================================================
 
-def fig2_jerarquia_causas(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig2_jerarquia_causas_mortalidad.png')
+def fig2_jerarquia_causas(ts_cv, output_dir=OUTPUT_DIR):
     """
     Genera la figura de jerarquía de causas de mortalidad.
     Responde: ¿Cuál es la jerarquía de las principales causas?
@@ -173,16 +428,16 @@ def fig2_jerarquia_causas(df, output_dir=OUTPUT_DIR):
     print("\n" + "="*60)
     print("FIGURA 2: Jerarquía de Causas de Mortalidad")
     print("="*60)
-    
+
     # Datos promedio por causa
-    causas_data = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                     (df['sexo'] == 'Ambos sexos')].groupby('causa_mortalidad')['tasa_mortalidad'].mean()
+    causas_data = ts_cv.xs('Ambos sexos', level='sexo')['tasa_mortalidad'] \
+        .groupby(level='causa_mortalidad', observed=True, sort=False).mean()
     causas_data = causas_data.sort_values(ascending=True)
     
     # Excluir 'General'
     causas_especificas = causas_data.drop('General')
     
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = obtener_ejes((12, 6))
     
     # Colores
     colors_list = [COLORS.get(c.lower(), '#718096') for c in causas_especificas.index]
@@ -191,10 +446,10 @@ def fig2_jerarquia_causas(df, output_dir=OUTPUT_DIR):
     bars = ax.barh(causas_especificas.index, causas_especificas.values, 
                    color=colors_list, edgecolor='white', linewidth=2, height=0.6)
     
-    # Etiquetas
-    for bar, val in zip(bars, causas_especificas.values):
-        ax.text(val + 3, bar.get_y() + bar.get_height()/2, 
-                f'{val:.1f}', va='center', ha='left', fontweight='bold', fontsize=12)
+    # Etiquetas: las barras caen en y = 0..n-1, no hace falta consultar cada parche
+    estilo_etiqueta = dict(va='center', ha='left', fontweight='bold', fontsize=12)
+    for i, val in enumerate(causas_especificas.values):
+        ax.text(val + 3, i, f'{val:.1f}', **estilo_etiqueta)
     
     # Configuración
     ax.set_xlabel('Tasa de Mortalidad Promedio (por 100.000 hab.)', fontweight='bold')
@@ -206,15 +461,15 @@ def fig2_jerarquia_causas(df, output_dir=OUTPUT_DIR):
     # Renombrar etiquetas
     labels_map = {'Cancer': 'Cáncer', 'Cardio': 'Cardiopatía Isquémica', 
                   'Cerebro': 'Enf. Cerebrovascular', 'Suicidio': 'Suicidio'}
-    ax.set_yticklabels([labels_map.get(l, l) for l in causas_especificas.index])
+    ax.set_yticks(range(len(causas_especificas)),
+                  [labels_map.get(l, l) for l in causas_especificas.index])
     
     ax.xaxis.grid(True, linestyle='--', alpha=0.4)
     ax.yaxis.grid(False)
     
-    plt.tight_layout()
+    fig.tight_layout()
     filepath = os.path.join(output_dir, 'fig2_jerarquia_causas_mortalidad.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -223,7 +478,17 @@ def fig2_jerarquia_causas(df, output_dir=OUTPUT_DIR):
 # FIGURA 3: EVOLUCIÓN TEMPORAL POR CAUSA ESPECÍFICA
 # ============================================================================
 
-def fig3_evolucion_causas_especificas(df, output_dir=OUTPUT_DIR):
+def estadisticas_tendencia(mat):
+    """
+    Estadísticos de tendencia por lotes sobre una matriz (series x años):
+    devuelve (inicio, fin, cambio porcentual) como arrays, uno por serie.
+    """
+    inicio = mat[:, 0]
+    fin = mat[:, -1]
+    return inicio, fin, (fin - inicio) / inicio * 100
+
+@figura_cacheada('fig3_evolucion_causas_especificas.png')
+def fig3_evolucion_causas_especificas(series, output_dir=OUTPUT_DIR):
     """
     Genera panel 2x2 con evolución de cada causa específica.
     Responde: ¿Cómo han variado las causas en el tiempo?
@@ -232,33 +497,31 @@ def fig3_evolucion_causas_especificas(df, output_dir=OUTPUT_DIR):
     print("FIGURA 3: Evolución Temporal por Causa Específica")
     print("="*60)
     
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = obtener_ejes((14, 10), 2, 2)
     axes = axes.flatten()
     
     causas = ['Cancer', 'Cardio', 'Cerebro', 'Suicidio']
-    titulos = ['Cáncer (Neoplasias)', 'Cardiopatía Isquémica', 
+    titulos = ['Cáncer (Neoplasias)', 'Cardiopatía Isquémica',
                'Enfermedad Cerebrovascular', 'Suicidio']
-    
+
+    # Tendencias de las 4 causas calculadas de una vez sobre la matriz apilada
+    _, _, cambios = estadisticas_tendencia(
+        np.vstack([series[(causa, 'Ambos sexos')][1] for causa in causas]))
+
     for idx, (causa, titulo) in enumerate(zip(causas, titulos)):
         ax = axes[idx]
-        
-        data = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                  (df['causa_mortalidad'] == causa) &
-                  (df['sexo'] == 'Ambos sexos')].sort_values('periodo')
-        
+
+        anyos, tasa, _ = series[(causa, 'Ambos sexos')]
+
         # Sombrear COVID
         ax.axvspan(2019.5, 2021.5, alpha=0.2, color='#fed7d7')
-        
-        ax.plot(data['periodo'], data['tasa_mortalidad'], 
+
+        ax.plot(anyos, tasa,
                 color=COLORS[causa.lower()], linewidth=2.5, marker='o', markersize=6,
-                markeredgecolor='white', markeredgewidth=1)
-        
-        # Calcular tendencia
-        inicio = data[data['periodo'] == 2010]['tasa_mortalidad'].values[0]
-        fin = data[data['periodo'] == 2023]['tasa_mortalidad'].values[0]
-        cambio = ((fin - inicio) / inicio) * 100
-        
+                path_effects=[pe.withStroke(linewidth=3.5, foreground='white')])
+
         # Indicador de tendencia
+        cambio = cambios[idx]
         if cambio < 0:
             tendencia_text = f'↓ {abs(cambio):.1f}%'
             color_tend = '#276749'
@@ -280,13 +543,12 @@ def fig3_evolucion_causas_especificas(df, output_dir=OUTPUT_DIR):
         ax.xaxis.grid(False)
     
     fig.suptitle('Evolución de las Causas Específicas de Mortalidad (2010-2023)\n'
-                 'Comunitat Valenciana - Ambos Sexos', 
-                 fontsize=14, fontweight='bold', y=1.02)
-    
-    plt.tight_layout()
+                 'Comunitat Valenciana - Ambos Sexos',
+                 fontsize=14, fontweight='bold', y=0.99)
+
+    fig.tight_layout(rect=(0, 0, 1, 0.94))
     filepath = os.path.join(output_dir, 'fig3_evolucion_causas_especificas.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -295,7 +557,8 @@ def fig3_evolucion_causas_especificas(df, output_dir=OUTPUT_DIR):
 # FIGURA 4: DISPARIDADES DE GÉNERO - RATIO H/M
 # ============================================================================
 
-def fig4_disparidad_genero_ratio(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig4_disparidad_genero_ratio.png')
+def fig4_disparidad_genero_ratio(ts_cv, output_dir=OUTPUT_DIR):
     """
     Genera figura de ratio de mortalidad hombres/mujeres.
     Responde: ¿Existen diferencias significativas entre sexos?
@@ -303,26 +566,20 @@ def fig4_disparidad_genero_ratio(df, output_dir=OUTPUT_DIR):
     print("\n" + "="*60)
     print("FIGURA 4: Disparidades de Género - Ratio H/M")
     print("="*60)
-    
-    # Calcular ratios
+
+    # Calcular ratios: una sola tabla de medias causa x sexo en vez de
+    # dos búsquedas + mean por causa
     causas = ['General', 'Cancer', 'Cardio', 'Cerebro', 'Suicidio']
-    ratios = []
-    
-    for causa in causas:
-        h = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-               (df['causa_mortalidad'] == causa) & 
-               (df['sexo'] == 'Hombres')]['tasa_mortalidad'].mean()
-        m = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-               (df['causa_mortalidad'] == causa) & 
-               (df['sexo'] == 'Mujeres')]['tasa_mortalidad'].mean()
-        ratios.append(h/m)
+    piv = ts_cv['tasa_mortalidad'] \
+        .groupby(level=['causa_mortalidad', 'sexo'], observed=True, sort=False).mean().unstack('sexo')
+    ratios = (piv['Hombres'] / piv['Mujeres']).reindex(causas).tolist()
     
     # Ordenar
     orden = np.argsort(ratios)[::-1]
     causas_ord = [causas[i] for i in orden]
     ratios_ord = [ratios[i] for i in orden]
     
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = obtener_ejes((12, 7))
     
     colors = plt.cm.RdYlGn_r(np.linspace(0.2, 0.8, len(ratios_ord)))
     
@@ -335,10 +592,10 @@ def fig4_disparidad_genero_ratio(df, output_dir=OUTPUT_DIR):
                   'Cardio': 'Cardiopatía Isquémica', 'Cerebro': 'Enf. Cerebrovascular', 
                   'Suicidio': 'Suicidio'}
     
-    for i, (bar, ratio) in enumerate(zip(bars, ratios_ord)):
-        ax.text(ratio + 0.08, bar.get_y() + bar.get_height()/2, 
-                f'{ratio:.2f}x', va='center', ha='left', fontweight='bold', fontsize=13,
-                color='#1a365d')
+    estilo_etiqueta = dict(va='center', ha='left', fontweight='bold', fontsize=13,
+                           color='#1a365d')
+    for i, ratio in enumerate(ratios_ord):
+        ax.text(ratio + 0.08, i, f'{ratio:.2f}x', **estilo_etiqueta)
     
     ax.set_yticks(range(len(causas_ord)))
     ax.set_yticklabels([labels_map[c] for c in causas_ord], fontsize=12)
@@ -351,10 +608,9 @@ def fig4_disparidad_genero_ratio(df, output_dir=OUTPUT_DIR):
     ax.yaxis.grid(False)
     ax.legend(loc='lower right')
     
-    plt.tight_layout()
+    fig.tight_layout()
     filepath = os.path.join(output_dir, 'fig4_disparidad_genero_ratio.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -363,7 +619,8 @@ def fig4_disparidad_genero_ratio(df, output_dir=OUTPUT_DIR):
 # FIGURA 5: COMPARATIVA DE TASAS POR SEXO
 # ============================================================================
 
-def fig5_comparativa_sexo_causa(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig5_comparativa_sexo_causa.png')
+def fig5_comparativa_sexo_causa(ts_cv, output_dir=OUTPUT_DIR):
     """
     Genera barras agrupadas comparando tasas absolutas H vs M.
     """
@@ -374,20 +631,13 @@ def fig5_comparativa_sexo_causa(df, output_dir=OUTPUT_DIR):
     causas = ['Cancer', 'Cardio', 'Cerebro', 'Suicidio']
     labels_causas = ['Cáncer', 'Cardiopatía\nIsquémica', 'Enf.\nCerebrovascular', 'Suicidio']
     
-    tasas_h = []
-    tasas_m = []
-    
-    for causa in causas:
-        h = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-               (df['causa_mortalidad'] == causa) & 
-               (df['sexo'] == 'Hombres')]['tasa_mortalidad'].mean()
-        m = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-               (df['causa_mortalidad'] == causa) & 
-               (df['sexo'] == 'Mujeres')]['tasa_mortalidad'].mean()
-        tasas_h.append(h)
-        tasas_m.append(m)
+    # Medias por causa y sexo calculadas en una sola pasada
+    piv = ts_cv['tasa_mortalidad'] \
+        .groupby(level=['causa_mortalidad', 'sexo'], observed=True, sort=False).mean().unstack('sexo')
+    tasas_h = piv['Hombres'].reindex(causas).values
+    tasas_m = piv['Mujeres'].reindex(causas).values
     
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = obtener_ejes((12, 7))
     
     x = np.arange(len(causas))
     width = 0.35
@@ -397,21 +647,14 @@ def fig5_comparativa_sexo_causa(df, output_dir=OUTPUT_DIR):
     bars_m = ax.bar(x + width/2, tasas_m, width, label='Mujeres', 
                     color=COLORS['mujer'], edgecolor='white', linewidth=2)
     
-    for bar in bars_h:
-        height = bar.get_height()
-        ax.annotate(f'{height:.1f}',
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3), textcoords="offset points",
-                    ha='center', va='bottom', fontweight='bold', fontsize=10,
-                    color=COLORS['hombre'])
-    
-    for bar in bars_m:
-        height = bar.get_height()
-        ax.annotate(f'{height:.1f}',
-                    xy=(bar.get_x() + bar.get_width() / 2, height),
-                    xytext=(0, 3), textcoords="offset points",
-                    ha='center', va='bottom', fontweight='bold', fontsize=10,
-                    color=COLORS['mujer'])
+    # Los centros de las barras son x ± width/2: se anotan directamente sin
+    # consultar la geometría de cada parche
+    estilo_etiqueta = dict(xytext=(0, 3), textcoords='offset points',
+                           ha='center', va='bottom', fontweight='bold', fontsize=10)
+    for xs, tasas, color in ((x - width/2, tasas_h, COLORS['hombre']),
+                             (x + width/2, tasas_m, COLORS['mujer'])):
+        for xi, alto in zip(xs, tasas):
+            ax.annotate(f'{alto:.1f}', xy=(xi, alto), color=color, **estilo_etiqueta)
     
     ax.set_xlabel('Causa de Mortalidad', fontweight='bold')
     ax.set_ylabel('Tasa de Mortalidad (por 100.000 hab.)', fontweight='bold')
@@ -424,10 +667,9 @@ def fig5_comparativa_sexo_causa(df, output_dir=OUTPUT_DIR):
     ax.yaxis.grid(True, linestyle='--', alpha=0.3)
     ax.xaxis.grid(False)
     
-    plt.tight_layout()
+    fig.tight_layout()
     filepath = os.path.join(output_dir, 'fig5_comparativa_sexo_causa.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -436,7 +678,8 @@ def fig5_comparativa_sexo_causa(df, output_dir=OUTPUT_DIR):
 # FIGURA 6: ESPERANZA DE VIDA POR SEXO
 # ============================================================================
 
-def fig6_esperanza_vida_genero(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig6_esperanza_vida_genero.png')
+def fig6_esperanza_vida_genero(series, output_dir=OUTPUT_DIR):
     """
     Genera evolución temporal de esperanza de vida por sexo.
     """
@@ -444,29 +687,23 @@ def fig6_esperanza_vida_genero(df, output_dir=OUTPUT_DIR):
     print("FIGURA 6: Esperanza de Vida por Sexo")
     print("="*60)
     
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig, ax = obtener_ejes((14, 7))
     
     ax.axvspan(2019.5, 2021.5, alpha=0.2, color='#fed7d7', label='Período COVID-19')
     
-    for sexo, color, marker in [('Hombres', COLORS['hombre'], 's'), 
+    for sexo, color, marker in [('Hombres', COLORS['hombre'], 's'),
                                  ('Mujeres', COLORS['mujer'], '^'),
                                  ('Ambos sexos', COLORS['ambos'], 'o')]:
-        data = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                  (df['causa_mortalidad'] == 'General') &
-                  (df['sexo'] == sexo)].sort_values('periodo')
-        ax.plot(data['periodo'], data['esperanza_vida'], 
+        anyos, _, esperanza = series[('General', sexo)]
+        ax.plot(anyos, esperanza,
                 color=color, linewidth=2.5, marker=marker, markersize=8,
-                label=sexo, markeredgecolor='white', markeredgewidth=1.5)
-    
+                label=sexo, path_effects=[pe.withStroke(linewidth=3.5, foreground='white')])
+
     # Brecha 2023
-    ev_h_2023 = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                   (df['causa_mortalidad'] == 'General') &
-                   (df['sexo'] == 'Hombres') & 
-                   (df['periodo'] == 2023)]['esperanza_vida'].values[0]
-    ev_m_2023 = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                   (df['causa_mortalidad'] == 'General') &
-                   (df['sexo'] == 'Mujeres') & 
-                   (df['periodo'] == 2023)]['esperanza_vida'].values[0]
+    anyos, _, ev_h = series[('General', 'Hombres')]
+    _, _, ev_m = series[('General', 'Mujeres')]
+    ev_h_2023 = ev_h[anyos == 2023][0]
+    ev_m_2023 = ev_m[anyos == 2023][0]
     
     ax.annotate('', xy=(2023.3, ev_m_2023), xytext=(2023.3, ev_h_2023),
                 arrowprops=dict(arrowstyle='<->', color='#2d3748', lw=2))
@@ -489,10 +726,9 @@ def fig6_esperanza_vida_genero(df, output_dir=OUTPUT_DIR):
     ax.yaxis.grid(True, linestyle='--', alpha=0.3)
     ax.xaxis.grid(False)
     
-    plt.tight_layout()
+    fig.tight_layout()
     filepath = os.path.join(output_dir, 'fig6_esperanza_vida_genero.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -501,21 +737,18 @@ def fig6_esperanza_vida_genero(df, output_dir=OUTPUT_DIR):
 # FIGURA 7: RANKING DE DEPARTAMENTOS
 # ============================================================================
 
-def fig7_ranking_departamentos(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig7_ranking_departamentos.png')
+def fig7_ranking_departamentos(ts, output_dir=OUTPUT_DIR):
     """
     Genera ranking de departamentos por mortalidad.
     """
     print("\n" + "="*60)
     print("FIGURA 7: Ranking de Departamentos de Salud")
     print("="*60)
+
+    ranking = obtener_ranking_departamentos(ts)
     
-    ranking = df[(df['causa_mortalidad'] == 'General') & 
-                 (df['sexo'] == 'Ambos sexos') &
-                 (df['nivel_geografico'] == 'DEPARTAMENTO')].groupby(
-        ['ubicacion', 'provincia']
-    ).agg({'tasa_mortalidad': 'mean'}).reset_index().sort_values('tasa_mortalidad', ascending=True)
-    
-    fig, ax = plt.subplots(figsize=(12, 10))
+    fig, ax = obtener_ejes((12, 10))
     
     provincia_colors = {
         'Alicante': COLORS['alicante'],
@@ -531,9 +764,9 @@ def fig7_ranking_departamentos(df, output_dir=OUTPUT_DIR):
     media = ranking['tasa_mortalidad'].mean()
     ax.axvline(x=media, color='#c53030', linestyle='--', linewidth=2, label=f'Media: {media:.1f}')
     
-    for i, (idx, row) in enumerate(ranking.iterrows()):
-        ax.text(row['tasa_mortalidad'] + 5, i, f"{row['tasa_mortalidad']:.1f}", 
-                va='center', ha='left', fontsize=9, fontweight='bold')
+    estilo_etiqueta = dict(va='center', ha='left', fontsize=9, fontweight='bold')
+    for i, val in enumerate(ranking['tasa_mortalidad'].to_numpy()):
+        ax.text(val + 5, i, f'{val:.1f}', **estilo_etiqueta)
     
     ax.set_yticks(range(len(ranking)))
     ax.set_yticklabels(ranking['ubicacion'], fontsize=9)
@@ -554,10 +787,9 @@ def fig7_ranking_departamentos(df, output_dir=OUTPUT_DIR):
     ax.xaxis.grid(True, linestyle='--', alpha=0.3)
     ax.yaxis.grid(False)
     
-    plt.tight_layout()
+    fig.tight_layout()
     filepath = os.path.join(output_dir, 'fig7_ranking_departamentos.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -566,38 +798,66 @@ def fig7_ranking_departamentos(df, output_dir=OUTPUT_DIR):
 # FIGURA 8: HEATMAP DEPARTAMENTOS x AÑO
 # ============================================================================
 
-def fig8_heatmap_departamentos(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig8_heatmap_departamentos.webp')
+def fig8_heatmap_departamentos(ts, output_dir=OUTPUT_DIR):
     """
     Genera mapa de calor de mortalidad por departamento y año.
     """
     print("\n" + "="*60)
     print("FIGURA 8: Heatmap - Mortalidad por Departamento y Año")
     print("="*60)
-    
-    heatmap_data = df[(df['causa_mortalidad'] == 'General') & 
-                  (df['sexo'] == 'Ambos sexos') &
-                  (df['nivel_geografico'] == 'DEPARTAMENTO')].pivot_table(
-    index='ubicacion',
-    columns='periodo',
-    values='tasa_mortalidad'
-)
+
+    dep = ts.xs(('General', 'Ambos sexos'), level=('causa_mortalidad', 'sexo'))
+    sub = dep.loc[dep['nivel_geografico'] == 'DEPARTAMENTO', 'tasa_mortalidad'].reset_index()
+
+    # Pivot directo en numpy: acumular suma y cuenta por códigos factorizados
+    # evita la iteración por grupos de pivot_table
+    ri, filas = pd.factorize(sub['ubicacion'])
+    ci, cols = pd.factorize(sub['periodo'])
+    suma = np.zeros((len(filas), len(cols)))
+    cuenta = np.zeros_like(suma)
+    np.add.at(suma, (ri, ci), sub['tasa_mortalidad'].to_numpy())
+    np.add.at(cuenta, (ri, ci), 1)
+    promedio = np.divide(suma, cuenta, out=np.full_like(suma, np.nan), where=cuenta > 0)
+    heatmap_data = pd.DataFrame(promedio, index=filas, columns=cols)
     
     heatmap_data['promedio'] = heatmap_data.mean(axis=1)
     heatmap_data = heatmap_data.sort_values('promedio', ascending=False)
     heatmap_data = heatmap_data.drop('promedio', axis=1)
     
-    fig, ax = plt.subplots(figsize=(16, 10))
-    
-    sns.heatmap(heatmap_data, annot=True, fmt='.0f', cmap='RdYlGn_r',
-                linewidths=0.5, linecolor='white',
-                cbar_kws={'label': 'Tasa de Mortalidad (por 100.000 hab.)', 'shrink': 0.8},
-                annot_kws={'size': 8},
-                ax=ax)
-    
+    fig, ax = obtener_ejes((16, 10))
+
+    # imshow + anotaciones manuales: mismo resultado que seaborn.heatmap pero
+    # sin el coste de validar un artista por celda (ni depender de seaborn)
+    valores = heatmap_data.values
+    im = ax.imshow(valores, cmap='RdYlGn_r', aspect='auto')
+    cbar = fig.colorbar(im, ax=ax, shrink=0.8)
+    cbar.set_label('Tasa de Mortalidad (por 100.000 hab.)')
+
+    ax.set_xticks(range(len(heatmap_data.columns)))
+    ax.set_xticklabels(heatmap_data.columns)
+    ax.set_yticks(range(len(heatmap_data.index)))
+    ax.set_yticklabels(heatmap_data.index)
+
+    # Rejilla blanca entre celdas (la rejilla mayor no pinta sobre la imagen)
+    ax.grid(False)
+    ax.set_xticks(np.arange(-0.5, len(heatmap_data.columns)), minor=True)
+    ax.set_yticks(np.arange(-0.5, len(heatmap_data.index)), minor=True)
+    ax.grid(which='minor', color='white', linewidth=0.5)
+    ax.tick_params(which='minor', length=0)
+
+    # Etiquetas numéricas formateadas de una vez; blanco sobre celdas oscuras
+    etiquetas = np.char.mod('%.0f', valores)
+    luminancia = im.cmap(im.norm(valores))[..., :3] @ np.array([0.299, 0.587, 0.114])
+    for (i, j), texto in np.ndenumerate(etiquetas):
+        if np.isfinite(valores[i, j]):
+            ax.text(j, i, texto, ha='center', va='center', fontsize=8,
+                    color='white' if luminancia[i, j] < 0.408 else 'black')
+
     # Destacar COVID
     for i, col in enumerate(heatmap_data.columns):
         if col in [2020, 2021]:
-            ax.add_patch(plt.Rectangle((i, 0), 1, len(heatmap_data), 
+            ax.add_patch(plt.Rectangle((i - 0.5, -0.5), 1, len(heatmap_data),
                                         fill=False, edgecolor='red', linewidth=3))
     
     ax.set_title('Mapa de Calor: Mortalidad General por Departamento y Año (2010-2023)\n'
@@ -606,10 +866,9 @@ def fig8_heatmap_departamentos(df, output_dir=OUTPUT_DIR):
     ax.set_xlabel('Año', fontweight='bold')
     ax.set_ylabel('Departamento de Salud', fontweight='bold')
     
-    plt.tight_layout()
-    filepath = os.path.join(output_dir, 'fig8_heatmap_departamentos.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    fig.tight_layout()
+    filepath = os.path.join(output_dir, 'fig8_heatmap_departamentos.webp')
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -618,7 +877,16 @@ def fig8_heatmap_departamentos(df, output_dir=OUTPUT_DIR):
 # FIGURA 9: TENDENCIA DEL SUICIDIO
 # ============================================================================
 
-def fig9_tendencia_suicidio(df, output_dir=OUTPUT_DIR):
+def _ajuste_lineal(x, y):
+    """Recta de mínimos cuadrados en forma cerrada (evita el SVD de polyfit)."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    dx = x - x.mean()
+    pendiente = (dx * (y - y.mean())).sum() / (dx * dx).sum()
+    return pendiente, y.mean() - pendiente * x.mean()
+
+@figura_cacheada('fig9_tendencia_suicidio.png')
+def fig9_tendencia_suicidio(series, output_dir=OUTPUT_DIR):
     """
     Genera figura de tendencia del suicidio.
     """
@@ -626,47 +894,35 @@ def fig9_tendencia_suicidio(df, output_dir=OUTPUT_DIR):
     print("FIGURA 9: Tendencia del Suicidio")
     print("="*60)
     
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig, ax = obtener_ejes((14, 7))
     
     ax.axvspan(2019.5, 2021.5, alpha=0.15, color='#fed7d7')
     
-    for sexo, color, marker in [('Ambos sexos', COLORS['ambos'], 'o'), 
-                                 ('Hombres', COLORS['hombre'], 's'), 
+    for sexo, color, marker in [('Ambos sexos', COLORS['ambos'], 'o'),
+                                 ('Hombres', COLORS['hombre'], 's'),
                                  ('Mujeres', COLORS['mujer'], '^')]:
-        data = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                  (df['causa_mortalidad'] == 'Suicidio') &
-                  (df['sexo'] == sexo)].sort_values('periodo')
-        ax.plot(data['periodo'], data['tasa_mortalidad'], 
+        anyos, tasa, _ = series[('Suicidio', sexo)]
+        ax.plot(anyos, tasa,
                 color=color, linewidth=2.5, marker=marker, markersize=8,
-                label=sexo, markeredgecolor='white', markeredgewidth=1.5)
-    
+                label=sexo, path_effects=[pe.withStroke(linewidth=3.5, foreground='white')])
+
     # Línea de tendencia
-    data_ambos = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                    (df['causa_mortalidad'] == 'Suicidio') &
-                    (df['sexo'] == 'Ambos sexos')].sort_values('periodo')
-    z = np.polyfit(data_ambos['periodo'], data_ambos['tasa_mortalidad'], 1)
-    p = np.poly1d(z)
-    ax.plot(data_ambos['periodo'], p(data_ambos['periodo']), 
+    anyos, tasa_ambos, _ = series[('Suicidio', 'Ambos sexos')]
+    pendiente, ordenada = _ajuste_lineal(anyos, tasa_ambos)
+    ax.plot(anyos, pendiente * anyos + ordenada,
             '--', color=COLORS['ambos'], alpha=0.5, linewidth=2, label='Tendencia lineal')
-    
+
     # Anotaciones
-    inicio = data_ambos[data_ambos['periodo'] == 2010]['tasa_mortalidad'].values[0]
-    fin = data_ambos[data_ambos['periodo'] == 2023]['tasa_mortalidad'].values[0]
-    cambio = ((fin - inicio) / inicio) * 100
-    
-    ax.annotate(f'↑ {cambio:.1f}%\n(2010-2023)', 
+    _, fin, cambio = (v[0] for v in estadisticas_tendencia(tasa_ambos[np.newaxis]))
+
+    ax.annotate(f'↑ {cambio:.1f}%\n(2010-2023)',
                 xy=(2023, fin), xytext=(2022, fin + 1.5),
                 fontsize=11, ha='center', fontweight='bold',
                 arrowprops=dict(arrowstyle='->', color='#c53030', lw=1.5),
                 color='#c53030')
-    
+
     # Ratio H/M
-    ratio_hm = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                  (df['causa_mortalidad'] == 'Suicidio') &
-                  (df['sexo'] == 'Hombres')]['tasa_mortalidad'].mean() / \
-               df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                  (df['causa_mortalidad'] == 'Suicidio') &
-                  (df['sexo'] == 'Mujeres')]['tasa_mortalidad'].mean()
+    ratio_hm = series[('Suicidio', 'Hombres')][1].mean() / series[('Suicidio', 'Mujeres')][1].mean()
     
     ax.text(0.98, 0.98, f'Ratio Hombres/Mujeres: {ratio_hm:.1f}x\n'
             'Los hombres tienen una tasa 3 veces mayor',
@@ -684,10 +940,9 @@ def fig9_tendencia_suicidio(df, output_dir=OUTPUT_DIR):
     ax.yaxis.grid(True, linestyle='--', alpha=0.3)
     ax.xaxis.grid(False)
     
-    plt.tight_layout()
+    fig.tight_layout()
     filepath = os.path.join(output_dir, 'fig9_tendencia_suicidio.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -696,7 +951,8 @@ def fig9_tendencia_suicidio(df, output_dir=OUTPUT_DIR):
 # FIGURA 10: SCATTER CORRELACIÓN
 # ============================================================================
 
-def fig10_scatter_correlacion(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig10_scatter_correlacion.png')
+def fig10_scatter_correlacion(ts, output_dir=OUTPUT_DIR):
     """
     Genera scatter plot de correlación mortalidad vs esperanza de vida.
     """
@@ -704,20 +960,25 @@ def fig10_scatter_correlacion(df, output_dir=OUTPUT_DIR):
     print("FIGURA 10: Scatter - Correlación Mortalidad vs Esperanza de Vida")
     print("="*60)
 
-    # Filtro correcto según el dataset
-    scatter_data = df[
-        (df['causa_mortalidad'] == 'General') &
-        (df['nivel_geografico'] == 'DEPARTAMENTO')
-    ]
+    # Import local: fig10 es la única consumidora de scipy y su cadena de
+    # import (BLAS/Fortran) encarece el arranque del resto del script
+    from scipy import special
+
+    # Corte por nivel del índice + filtro de la única clave no indexada
+    scatter_data = ts.xs('General', level='causa_mortalidad')
+    scatter_data = scatter_data[scatter_data['nivel_geografico'] == 'DEPARTAMENTO']
 
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = obtener_ejes((12, 8))
+    fig.set_layout_engine('constrained')
 
-    # Scatter por sexo
+    # Scatter por sexo. Con rasterized=True la nube de puntos se vuelca como
+    # raster dentro del lienzo en vez de como cientos de marcadores
+    # vectoriales; ejes, leyenda y regresión siguen siendo vectoriales.
     for sexo, color, marker, alpha in [
         ('Hombres', COLORS['hombre'], 's', 0.6),
         ('Mujeres', COLORS['mujer'], '^', 0.6)
     ]:
-        data = scatter_data[scatter_data['sexo'] == sexo]
+        data = scatter_data.xs(sexo, level='sexo')
         ax.scatter(
             data['tasa_mortalidad'],
             data['esperanza_vida'],
@@ -726,7 +987,8 @@ def fig10_scatter_correlacion(df, output_dir=OUTPUT_DIR):
             s=50,
             alpha=alpha,
             label=sexo,
-            edgecolors='white'
+            edgecolors='white',
+            rasterized=True
         )
 
     # Datos válidos para correlación y regresión
@@ -734,27 +996,38 @@ def fig10_scatter_correlacion(df, output_dir=OUTPUT_DIR):
 
     if len(datos) < 2:
         print(f"⚠️ FIG10: no hay suficientes pares para correlación/regresión (n={len(datos)}).")
-        plt.close()
-        return None
-
-    x = datos['tasa_mortalidad'].values
-    y = datos['esperanza_vida'].values
-
-    # Regresión lineal
-    slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
-    x_line = np.linspace(x.min(), x.max(), 100)
-    y_line = slope * x_line + intercept
-    ax.plot(
-        x_line,
-        y_line,
-        'k--',
+        return None  # la figura cacheada se limpia en el siguiente uso
+
+    x = np.ascontiguousarray(datos['tasa_mortalidad'].values, dtype=np.float64)
+    y = np.ascontiguousarray(datos['esperanza_vida'].values, dtype=np.float64)
+
+    # Regresión y correlación en forma cerrada a partir de cinco sumas
+    # (antes linregress y pearsonr recorrían los mismos arrays por separado)
+    n = len(x)
+    sx, sy = x.sum(), y.sum()
+    sxx, syy, sxy = x @ x, y @ y, x @ y
+    dx = n * sxx - sx * sx
+    slope = (n * sxy - sx * sy) / dx
+    intercept = (sy - slope * sx) / n
+    corr = (n * sxy - sx * sy) / np.sqrt(dx * (n * syy - sy * sy))
+    # p-valor bilateral del test t de la correlación (n - 2 grados de libertad)
+    t2 = corr * corr * (n - 2) / (1.0 - corr * corr)
+    pval = float(special.betainc(0.5 * (n - 2), 0.5, (n - 2) / (n - 2 + t2)))
+
+    # axline dibuja la recta infinita recortada al área de datos: dos puntos
+    # en lugar de 100 muestras interpoladas. Se ancla dentro de la nube para
+    # no ensanchar los límites del autoescalado.
+    x_medio = 0.5 * (x.min() + x.max())
+    ax.axline(
+        xy1=(x_medio, slope * x_medio + intercept),
+        slope=slope,
+        color='k',
+        linestyle='--',
         linewidth=2,
         alpha=0.7,
         label='Regresión lineal'
     )
 
-    # Correlación de Pearson
-    corr, pval = stats.pearsonr(x, y)
     ax.text(
         0.98,
         0.55,
@@ -784,10 +1057,8 @@ def fig10_scatter_correlacion(df, output_dir=OUTPUT_DIR):
     ax.yaxis.grid(True, linestyle='--', alpha=0.3)
     ax.xaxis.grid(True, linestyle='--', alpha=0.3)
 
-    plt.tight_layout()
     filepath = os.path.join(output_dir, 'fig10_scatter_correlacion.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
 
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -796,7 +1067,8 @@ def fig10_scatter_correlacion(df, output_dir=OUTPUT_DIR):
 # FIGURA 11: COMPARATIVA PROVINCIAS
 # ============================================================================
 
-def fig11_comparativa_provincias(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig11_comparativa_provincias.png')
+def fig11_comparativa_provincias(ts, output_dir=OUTPUT_DIR):
     """
     Genera comparativa temporal de las tres provincias.
     """
@@ -804,7 +1076,8 @@ def fig11_comparativa_provincias(df, output_dir=OUTPUT_DIR):
     print("FIGURA 11: Comparativa por Provincias")
     print("="*60)
     
-    fig, ax = plt.subplots(figsize=(14, 7))
+    fig, ax = obtener_ejes((14, 7))
+    fig.set_layout_engine('constrained')
     
     ax.axvspan(2019.5, 2021.5, alpha=0.15, color='#fed7d7')
     
@@ -814,21 +1087,21 @@ def fig11_comparativa_provincias(df, output_dir=OUTPUT_DIR):
         'Castellón': COLORS['castellon']
     }
     
+    sub = ts.xs(('General', 'Ambos sexos'), level=('causa_mortalidad', 'sexo'))
+    sub = sub[sub['nivel_geografico'] == 'PROVINCIA']
+    # Una tabla periodo x provincia de una sola pasada; cada columna es una
+    # serie lista para trazar (antes: una máscara por provincia)
+    series_prov = sub.groupby(['provincia', 'periodo'], observed=True)['tasa_mortalidad'] \
+        .first().unstack('provincia')
     for provincia, color in provincia_colors.items():
-        data = df[(df['provincia'] == provincia) & 
-                  (df['nivel_geografico'] == 'PROVINCIA') &
-                  (df['causa_mortalidad'] == 'General') &
-                  (df['sexo'] == 'Ambos sexos')].sort_values('periodo')
-        if len(data) > 0:
-            ax.plot(data['periodo'], data['tasa_mortalidad'], 
+        if provincia in series_prov.columns:
+            ax.plot(series_prov.index, series_prov[provincia], 
                     color=color, linewidth=2.5, marker='o', markersize=7,
                     label=provincia, markeredgecolor='white', markeredgewidth=1.5)
     
     # Media CV
-    cv_data = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                 (df['causa_mortalidad'] == 'General') &
-                 (df['sexo'] == 'Ambos sexos')].sort_values('periodo')
-    ax.plot(cv_data['periodo'], cv_data['tasa_mortalidad'], 
+    cv_data = obtener_cv_general_ambos(ts)
+    ax.plot(cv_data.index, cv_data['tasa_mortalidad'], 
             color='#1a365d', linewidth=3, linestyle='--', 
             label='Media CV', alpha=0.7)
     
@@ -843,10 +1116,8 @@ def fig11_comparativa_provincias(df, output_dir=OUTPUT_DIR):
     ax.yaxis.grid(True, linestyle='--', alpha=0.3)
     ax.xaxis.grid(False)
     
-    plt.tight_layout()
     filepath = os.path.join(output_dir, 'fig11_comparativa_provincias.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -855,7 +1126,8 @@ def fig11_comparativa_provincias(df, output_dir=OUTPUT_DIR):
 # FIGURA 12: IMPACTO COVID-19
 # ============================================================================
 
-def fig12_impacto_covid(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig12_impacto_covid.png')
+def fig12_impacto_covid(ts, output_dir=OUTPUT_DIR):
     """
     Genera análisis detallado del impacto COVID-19.
     """
@@ -863,21 +1135,24 @@ def fig12_impacto_covid(df, output_dir=OUTPUT_DIR):
     print("FIGURA 12: Impacto COVID-19 - Análisis Detallado")
     print("="*60)
     
-    cv_general = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                    (df['causa_mortalidad'] == 'General') &
-                    (df['sexo'] == 'Ambos sexos')].sort_values('periodo')
+    # Serie anual indexada por periodo: cada valor se lee por etiqueta en vez
+    # de construir una máscara booleana por año
+    tasa_anual = obtener_cv_general_ambos(ts)['tasa_mortalidad']
     
-    pre_covid = cv_general[cv_general['periodo'].isin([2018, 2019])]['tasa_mortalidad'].mean()
-    covid_2020 = cv_general[cv_general['periodo'] == 2020]['tasa_mortalidad'].values[0]
-    covid_2021 = cv_general[cv_general['periodo'] == 2021]['tasa_mortalidad'].values[0]
-    post_covid = cv_general[cv_general['periodo'].isin([2022, 2023])]['tasa_mortalidad'].mean()
+    # Medias por tramo (pre, 2020, 2021, post) con un solo groupby en vez de
+    # una selección + mean por tramo
+    tramos = pd.cut(tasa_anual.index, bins=[2017, 2019, 2020, 2021, 2023],
+                    labels=['pre', '2020', '2021', 'post'])
+    medias_tramo = tasa_anual.groupby(tramos, observed=True).mean()
+    valores = medias_tramo.to_numpy()
+    pre_covid = valores[0]
     
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig, axes = obtener_ejes((14, 6), 1, 2)
+    fig.set_layout_engine('constrained')
     
     # Panel izquierdo
     ax1 = axes[0]
     periodos = ['Pre-COVID\n(2018-2019)', '2020', '2021', 'Post-COVID\n(2022-2023)']
-    valores = [pre_covid, covid_2020, covid_2021, post_covid]
     colores = ['#38a169', '#c53030', '#c53030', '#3182ce']
     
     bars = ax1.bar(periodos, valores, color=colores, edgecolor='white', linewidth=2)
@@ -889,14 +1164,12 @@ def fig12_impacto_covid(df, output_dir=OUTPUT_DIR):
     ax1.axhline(y=pre_covid, color='#38a169', linestyle='--', linewidth=2, alpha=0.7)
     ax1.set_ylabel('Tasa de Mortalidad (por 100.000 hab.)', fontweight='bold')
     ax1.set_title('Comparativa de Mortalidad por Período', fontsize=12, fontweight='bold')
-    ax1.set_ylim(0, max(valores) * 1.18)
+    ax1.set_ylim(0, valores.max() * 1.18)
     
     # Panel derecho
     ax2 = axes[1]
-    variaciones = [0, 
-                   ((covid_2020 - pre_covid) / pre_covid) * 100,
-                   ((covid_2021 - pre_covid) / pre_covid) * 100,
-                   ((post_covid - pre_covid) / pre_covid) * 100]
+    # Variaciones frente a pre-COVID de una sola división vectorizada
+    variaciones = np.concatenate([[0.0], (valores[1:] - pre_covid) / pre_covid * 100])
     
     colors_var = ['#718096', '#c53030', '#c53030', '#3182ce']
     
@@ -916,16 +1189,14 @@ def fig12_impacto_covid(df, output_dir=OUTPUT_DIR):
     ax2.axhline(y=0, color='black', linewidth=1)
     ax2.set_ylabel('Variación respecto a Pre-COVID (%)', fontweight='bold')
     ax2.set_title('Exceso de Mortalidad', fontsize=12, fontweight='bold')
-    ax2.set_ylim(-1.5, max(variaciones) * 1.3)
+    ax2.set_ylim(-1.5, variaciones.max() * 1.3)
     
     fig.suptitle('Impacto del COVID-19 en la Mortalidad de la Comunitat Valenciana\n'
-                 'Análisis comparativo Pre-COVID, Durante y Post-COVID', 
-                 fontsize=14, fontweight='bold', y=1.02)
-    
-    plt.tight_layout()
+                 'Análisis comparativo Pre-COVID, Durante y Post-COVID',
+                 fontsize=14, fontweight='bold')
+
     filepath = os.path.join(output_dir, 'fig12_impacto_covid.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"✅ Guardada: {filepath}")
     return filepath
@@ -934,7 +1205,8 @@ def fig12_impacto_covid(df, output_dir=OUTPUT_DIR):
 # FIGURA 13: DASHBOARD RESUMEN 
 # ============================================================================
 
-def fig13_dashboard_resumen(df, output_dir=OUTPUT_DIR):
+@figura_cacheada('fig13_dashboard_resumen.png')
+def fig13_dashboard_resumen(ts, output_dir=OUTPUT_DIR):
     """
     Genera dashboard resumen con KPIs calculados dinámicamente.
     
@@ -954,14 +1226,15 @@ def fig13_dashboard_resumen(df, output_dir=OUTPUT_DIR):
     # CALCULAR TODOS LOS VALORES DINÁMICAMENTE
     # =========================================================================
     
-    # --- Filtro base ---
-    cv_general_ambos = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                          (df['causa_mortalidad'] == 'General') &
-                          (df['sexo'] == 'Ambos sexos')].sort_values('periodo')
+    # --- Corte autonómico único para todos los bloques de KPIs, filtro base
+    # compartido con fig11/12 y serie anual indexada por periodo ---
+    cv = ts.loc['Comunitat Valenciana']
+    cv_general_ambos = obtener_cv_general_ambos(ts)
+    tasa_anual = cv_general_ambos['tasa_mortalidad']
     
     # --- KPI 1: Mortalidad 2023 y cambio vs 2010 ---
-    mort_2023 = cv_general_ambos[cv_general_ambos['periodo'] == 2023]['tasa_mortalidad'].values[0]
-    mort_2010 = cv_general_ambos[cv_general_ambos['periodo'] == 2010]['tasa_mortalidad'].values[0]
+    mort_2023 = tasa_anual.at[2023]
+    mort_2010 = tasa_anual.at[2010]
     cambio_mort = ((mort_2023 - mort_2010) / mort_2010) * 100
     
     print(f"✓ KPI1 - Mortalidad 2023: {mort_2023:.2f} (cambio: {cambio_mort:.1f}%)")
@@ -973,61 +1246,52 @@ def fig13_dashboard_resumen(df, output_dir=OUTPUT_DIR):
     print(f"✓ KPI2 - Esperanza vida (2022): {ev_dashboard:.1f} años")
     
     # --- KPI 3: Brecha de género (2022) ---
-    cv_gen_2022 = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                     (df['causa_mortalidad'] == 'General') &
-                     (df['periodo'] == 2022)]
-    ev_h_2022 = cv_gen_2022[cv_gen_2022['sexo'] == 'Hombres']['esperanza_vida'].values[0]
-    ev_m_2022 = cv_gen_2022[cv_gen_2022['sexo'] == 'Mujeres']['esperanza_vida'].values[0]
+    ev_h_2022 = cv.at[('General', 'Hombres', 2022), 'esperanza_vida']
+    ev_m_2022 = cv.at[('General', 'Mujeres', 2022), 'esperanza_vida']
     brecha_genero = ev_m_2022 - ev_h_2022
     
     print(f"✓ KPI3 - Brecha género: {brecha_genero:.1f} años")
     
     # --- Exceso COVID: 2021 vs promedio histórico 2010-2019 ---
-    promedio_historico = cv_general_ambos[cv_general_ambos['periodo'] <= 2019]['tasa_mortalidad'].mean()
-    covid_2021 = cv_general_ambos[cv_general_ambos['periodo'] == 2021]['tasa_mortalidad'].values[0]
+    promedio_historico = tasa_anual.loc[:2019].mean()
+    covid_2021 = tasa_anual.at[2021]
     exceso_covid = ((covid_2021 - promedio_historico) / promedio_historico) * 100
     
     print(f"✓ Exceso COVID: +{exceso_covid:.1f}%")
     
-    # --- Impacto COVID para gráfico de barras ---
-    pre_covid = cv_general_ambos[cv_general_ambos['periodo'].isin([2018, 2019])]['tasa_mortalidad'].mean()
-    covid_2020 = cv_general_ambos[cv_general_ambos['periodo'] == 2020]['tasa_mortalidad'].values[0]
-    post_covid = cv_general_ambos[cv_general_ambos['periodo'].isin([2022, 2023])]['tasa_mortalidad'].mean()
-    
-    # --- Ratios H/M por causa ---
+    # --- Impacto COVID para gráfico de barras: medias por tramo con un solo
+    # groupby (mismo troceado que fig12) ---
+    tramos = pd.cut(tasa_anual.index, bins=[2017, 2019, 2020, 2021, 2023],
+                    labels=['pre', '2020', '2021', 'post'])
+    medias_tramo = tasa_anual.groupby(tramos, observed=True).mean()
+    pre_covid = medias_tramo.at['pre']
+    covid_2020 = medias_tramo.at['2020']
+    post_covid = medias_tramo.at['post']
+    
+    # --- Ratios H/M por causa: una tabla de medias causa x sexo en vez de
+    # diez filtros sobre el dataset completo ---
     causas_ratio = ['Suicidio', 'Cardio', 'Cancer', 'General', 'Cerebro']
-    ratios_calculados = []
-    
-    for causa in causas_ratio:
-        h = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-               (df['causa_mortalidad'] == causa) & 
-               (df['sexo'] == 'Hombres')]['tasa_mortalidad'].mean()
-        m = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-               (df['causa_mortalidad'] == causa) & 
-               (df['sexo'] == 'Mujeres')]['tasa_mortalidad'].mean()
-        ratios_calculados.append(h/m)
+    medias = cv['tasa_mortalidad'] \
+        .groupby(level=['causa_mortalidad', 'sexo'], observed=True) \
+        .mean().unstack('sexo')
+    ratios_calculados = (medias['Hombres'] / medias['Mujeres']).reindex(causas_ratio)
     
     print(f"✓ Ratios H/M: {[f'{r:.2f}' for r in ratios_calculados]}")
     
-    # --- Extremos por departamento ---
-    ranking = df[(df['causa_mortalidad'] == 'General') & 
-                 (df['sexo'] == 'Ambos sexos') &
-                 (df['nivel_geografico'] == 'HOSPITAL/ZONA SALUD')].groupby('ubicacion')['tasa_mortalidad'].mean()
+    # --- Extremos por departamento: mismo ranking memoizado que fig7, y
+    # min/max en una sola pasada ---
+    ranking = obtener_ranking_departamentos(ts).set_index('ubicacion')['tasa_mortalidad']
     
     top3 = ranking.nlargest(3)
     bottom3 = ranking.nsmallest(3)
-    disparidad = ((ranking.max() - ranking.min()) / ranking.min()) * 100
+    extremos = ranking.agg(['min', 'max'])
+    disparidad = ((extremos['max'] - extremos['min']) / extremos['min']) * 100
     
     print(f"✓ Disparidad territorial: {disparidad:.1f}%")
     
     # --- Suicidio ---
-    suicidio = df[(df['ubicacion'] == 'Comunitat Valenciana') & 
-                  (df['causa_mortalidad'] == 'Suicidio') &
-                  (df['sexo'] == 'Ambos sexos')].sort_values('periodo')
-    
-    suic_2010 = suicidio[suicidio['periodo'] == 2010]['tasa_mortalidad'].values[0]
-    suic_2023 = suicidio[suicidio['periodo'] == 2023]['tasa_mortalidad'].values[0]
-    cambio_suic = ((suic_2023 - suic_2010) / suic_2010) * 100
+    suicidio = cv.loc[('Suicidio', 'Ambos sexos'), 'tasa_mortalidad']
+    cambio_suic = ((suicidio.at[2023] - suicidio.at[2010]) / suicidio.at[2010]) * 100
     
     print(f"✓ Tendencia suicidio: +{cambio_suic:.1f}%")
     
@@ -1035,7 +1299,7 @@ def fig13_dashboard_resumen(df, output_dir=OUTPUT_DIR):
     # GENERAR FIGURA
     # =========================================================================
     
-    fig = plt.figure(figsize=(16, 12))
+    fig = obtener_figura((16, 12))
     gs = gridspec.GridSpec(3, 3, figure=fig, hspace=0.4, wspace=0.3)
     
     # --- KPI 1: Mortalidad 2023 ---
@@ -1074,10 +1338,10 @@ def fig13_dashboard_resumen(df, output_dir=OUTPUT_DIR):
     # --- Gráfico evolución temporal ---
     ax4 = fig.add_subplot(gs[1, :2])
     ax4.axvspan(2019.5, 2021.5, alpha=0.2, color='#fed7d7', label='Período COVID-19')
-    ax4.plot(cv_general_ambos['periodo'], cv_general_ambos['tasa_mortalidad'], 
+    ax4.plot(cv_general_ambos.index, cv_general_ambos['tasa_mortalidad'], 
              color=COLORS['primary'], linewidth=2.5, marker='o', markersize=6,
              markeredgecolor='white', markeredgewidth=1)
-    ax4.fill_between(cv_general_ambos['periodo'], cv_general_ambos['tasa_mortalidad'], 
+    ax4.fill_between(cv_general_ambos.index, cv_general_ambos['tasa_mortalidad'], 
                      alpha=0.1, color=COLORS['primary'])
     ax4.set_title('Evolución de la Mortalidad General (2010-2023)', fontweight='bold', fontsize=11)
     ax4.set_xlabel('Año')
@@ -1089,16 +1353,16 @@ def fig13_dashboard_resumen(df, output_dir=OUTPUT_DIR):
     
     # --- Ratio H/M por causa ---
     ax5 = fig.add_subplot(gs[1, 2])
-    orden = np.argsort(ratios_calculados)[::-1]
-    causas_ord = [causas_ratio[i] for i in orden]
-    ratios_ord = [ratios_calculados[i] for i in orden]
+    ratios_sorted = ratios_calculados.sort_values(ascending=False)
+    causas_ord = ratios_sorted.index.tolist()
+    ratios_ord = ratios_sorted.to_numpy()
     
     colors_ratio = plt.cm.Reds(np.linspace(0.3, 0.8, len(ratios_ord)))
     bars5 = ax5.barh(causas_ord, ratios_ord, color=colors_ratio, edgecolor='white', height=0.6)
     ax5.axvline(x=1, color='black', linestyle='--', alpha=0.5, linewidth=1.5)
     ax5.set_title('Ratio Mortalidad H/M', fontweight='bold', fontsize=11)
     ax5.set_xlabel('Ratio')
-    ax5.set_xlim(0, max(ratios_ord) * 1.15)
+    ax5.set_xlim(0, ratios_ord.max() * 1.15)
     ax5.spines['top'].set_visible(False)
     ax5.spines['right'].set_visible(False)
     for bar, ratio in zip(bars5, ratios_ord):
@@ -1144,10 +1408,10 @@ def fig13_dashboard_resumen(df, output_dir=OUTPUT_DIR):
     
     # --- Tendencia Suicidio ---
     ax8 = fig.add_subplot(gs[2, 2])
-    ax8.plot(suicidio['periodo'], suicidio['tasa_mortalidad'], 
+    ax8.plot(suicidio.index, suicidio.values, 
              color='#6b46c1', linewidth=2.5, marker='o', markersize=5,
              markeredgecolor='white', markeredgewidth=1)
-    ax8.fill_between(suicidio['periodo'], suicidio['tasa_mortalidad'], alpha=0.2, color='#6b46c1')
+    ax8.fill_between(suicidio.index, suicidio.values, alpha=0.2, color='#6b46c1')
     ax8.set_title(f'Tendencia Suicidio (+{cambio_suic:.1f}%)', fontweight='bold', fontsize=11)
     ax8.set_xlabel('Año')
     ax8.set_ylabel('Tasa por 100.000')
@@ -1163,8 +1427,7 @@ def fig13_dashboard_resumen(df, output_dir=OUTPUT_DIR):
     
     # --- Guardar ---
     filepath = os.path.join(output_dir, 'fig13_dashboard_resumen.png')
-    plt.savefig(filepath, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close()
+    guardar_figura(fig, filepath)
     
     print(f"\n✅ Guardada: {filepath}")
     return filepath
@@ -1173,10 +1436,52 @@ def fig13_dashboard_resumen(df, output_dir=OUTPUT_DIR):
 # FUNCIÓN PRINCIPAL
 # ============================================================================
 
+# Registro de figuras: función y datos que consume ('ts' = índice compartido,
+# 'ts_cv' = recorte autonómico,
+# 'df' = DataFrame plano). El orden define el orden de generación.
+FIGURAS = {
+    'fig1': (fig1_evolucion_mortalidad_general, 'series'),
+    'fig2': (fig2_jerarquia_causas, 'ts_cv'),
+    'fig3': (fig3_evolucion_causas_especificas, 'series'),
+    'fig4': (fig4_disparidad_genero_ratio, 'ts_cv'),
+    'fig5': (fig5_comparativa_sexo_causa, 'ts_cv'),
+    'fig6': (fig6_esperanza_vida_genero, 'series'),
+    'fig7': (fig7_ranking_departamentos, 'ts'),
+    'fig8': (fig8_heatmap_departamentos, 'ts'),
+    'fig9': (fig9_tendencia_suicidio, 'series'),
+    'fig10': (fig10_scatter_correlacion, 'ts'),
+    'fig11': (fig11_comparativa_provincias, 'ts'),
+    'fig12': (fig12_impacto_covid, 'ts'),
+    'fig13': (fig13_dashboard_resumen, 'ts'),
+}
+
+# Datos preparados una vez por proceso trabajador; la caché Parquet hace que
+# recargar el dataset en cada worker sea barato
+_DATOS_WORKER = {}
+
+def _preparar_datos(filepath_datos):
+    """Carga el dataset y construye las vistas que consumen las figuras."""
+    df = cargar_datos(filepath_datos)
+    ts = construir_indice(df)
+    ts_cv = construir_cv(ts)
+    return {'df': df, 'ts': ts, 'ts_cv': ts_cv, 'series': construir_series(ts_cv)}
+
+def _generar_figura(args):
+    """Genera una figura por nombre dentro de un proceso trabajador."""
+    nombre, filepath_datos = args
+    if filepath_datos not in _DATOS_WORKER:
+        _DATOS_WORKER[filepath_datos] = _preparar_datos(filepath_datos)
+    funcion, origen = FIGURAS[nombre]
+    return funcion(_DATOS_WORKER[filepath_datos][origen])
+
 def generar_todas_las_figuras(filepath_datos='data/mortalidad_esperanza_vida_opcion_c_v4_final.csv'):
     """
-    Genera todas las figuras del proyecto.
-    
+    Genera todas las figuras del proyecto en paralelo.
+
+    Cada figura es un render matplotlib independiente (CPU puro con el
+    backend Agg), así que se reparten entre procesos con
+    ProcessPoolExecutor y el tiempo total tiende al de la figura más lenta.
+
     Parameters:
     -----------
     filepath_datos : str
@@ -1186,30 +1491,31 @@ def generar_todas_las_figuras(filepath_datos='data/mortalidad_esperanza_vida_opc
     print("GENERACIÓN DE TODAS LAS FIGURAS")
     print("Proyecto: Mortalidad y Esperanza de Vida - Comunitat Valenciana 2010-2023")
     print("="*80)
-    
-    # Cargar datos
-    df = cargar_datos(filepath_datos)
-    
-    # Generar figuras
-    figuras = []
-    figuras.append(fig1_evolucion_mortalidad_general(df))
-    figuras.append(fig2_jerarquia_causas(df))
-    figuras.append(fig3_evolucion_causas_especificas(df))
-    figuras.append(fig4_disparidad_genero_ratio(df))
-    figuras.append(fig5_comparativa_sexo_causa(df))
-    figuras.append(fig6_esperanza_vida_genero(df))
-    figuras.append(fig7_ranking_departamentos(df))
-    figuras.append(fig8_heatmap_departamentos(df))
-    figuras.append(fig9_tendencia_suicidio(df))
-    figuras.append(fig10_scatter_correlacion(df))
-    figuras.append(fig11_comparativa_provincias(df))
-    figuras.append(fig12_impacto_covid(df))
-    figuras.append(fig13_dashboard_resumen(df))
-    
+
+    # Con el método de arranque fork, los datos preparados una sola vez en
+    # el proceso principal se heredan tal cual: ningún worker vuelve a
+    # cargar ni reindexar el dataset
+    if 'fork' in multiprocessing.get_all_start_methods():
+        contexto = multiprocessing.get_context('fork')
+        _DATOS_WORKER[filepath_datos] = _preparar_datos(filepath_datos)
+    else:
+        # Sin fork (Windows) cada worker recarga desde la caché Parquet
+        contexto = None
+        cargar_datos(filepath_datos)
+
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count(), len(FIGURAS)),
+                             mp_context=contexto) as ex:
+        figuras = list(ex.map(_generar_figura,
+                              [(nombre, filepath_datos) for nombre in FIGURAS]))
+
+    # Cada worker libera su Figure compartido al morir con el proceso; aquí
+    # se cierra el del proceso principal (lo crean las rutas sin fork)
+    cerrar_figuras()
+
     print("\n" + "="*80)
     print(f"✅ COMPLETADO: {len(figuras)} figuras generadas en '{OUTPUT_DIR}/'")
     print("="*80)
-    
+
     return figuras
 
 # ============================================================================